@@ -7,7 +7,7 @@ UI testing, and database operations.
 """
 
 # Local imports
-from .config import Config
+from .config import Config, LazyConfig
 from .exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -20,6 +20,7 @@ from .exceptions import (
 
 __all__ = [
     "Config",
+    "LazyConfig",
     # Exceptions
     "WebAutomationError",
     "ConfigurationError",
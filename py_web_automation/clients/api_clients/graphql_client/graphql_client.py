@@ -103,7 +103,7 @@ class GraphQLClient:
         if not url.strip():
             raise ValueError("url cannot be empty")
         if config is None:
-            config = Config()
+            config = Config.default()
         elif not isinstance(config, Config):
             raise TypeError("config must be a Config object")
         self.url: str = url
@@ -99,7 +99,7 @@ class SoapClient:
             ... )
         """
         if config is None:
-            config = Config()
+            config = Config.default()
         elif not isinstance(config, Config):
             raise TypeError("config must be a Config object")
         if soap_version not in ("1.1", "1.2"):
@@ -93,7 +93,7 @@ class WebSocketClient:
         if not (url.startswith("ws://") or url.startswith("wss://")):
             raise ValueError(f"Invalid WebSocket URL: {url}. Must start with ws:// or wss://")
         if config is None:
-            config = Config()
+            config = Config.default()
         elif not isinstance(config, Config):
             raise TypeError("config must be a Config object")
         self.url: str = url
@@ -61,7 +61,7 @@ class UiClient:
         if not url or not url.strip():
             raise ValueError("url cannot be empty")
         if config is None:
-            config = Config()
+            config = Config.default()
         elif not isinstance(config, Config):
             raise TypeError("config must be a Config object or None")
         self.url: str = url
@@ -58,7 +58,7 @@ class UiClient:
             >>> ui = SyncUiClient("https://example.com", Config(timeout=30))
         """
         if config is None:
-            config = Config()
+            config = Config.default()
         elif not isinstance(config, Config):
             raise TypeError("config must be a Config object or None")
         self.url: str = url
@@ -9,19 +9,69 @@ with validation, environment variable support, and YAML file loading.
 from __future__ import annotations
 
 import os
+from collections.abc import Callable, Mapping
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, get_args
 
 from msgspec import Struct, ValidationError
-from yaml import SafeLoader, load
+from yaml import load
 
+try:
+    # LibYAML-backed loader; same safe subset as SafeLoader, parsed in C
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-class Config(Struct, frozen=True):
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+# Hashed lookup for log level checks, derived from LogLevel so the two cannot drift
+_VALID_LOG_LEVELS: frozenset[str] = frozenset(get_args(LogLevel))
+# Inclusive bounds enforced by Config.__post_init__
+_TIMEOUT_MIN, _TIMEOUT_MAX = 1, 300
+_RETRY_COUNT_MIN, _RETRY_COUNT_MAX = 0, 10
+_RETRY_DELAY_MIN, _RETRY_DELAY_MAX = 0.1, 10.0
+_BROWSER_TIMEOUT_MIN, _BROWSER_TIMEOUT_MAX = 1000, 300000
+# Environment variables read by Config.from_env, in a fixed order for cache keys
+_WA_ENV_KEYS: tuple[str, ...] = (
+    "WA_BASE_URL",
+    "WA_TIMEOUT",
+    "WA_RETRY_COUNT",
+    "WA_RETRY_DELAY",
+    "WA_LOG_LEVEL",
+    "WA_BROWSER_HEADLESS",
+    "WA_BROWSER_TIMEOUT",
+)
+# Lowercase WA_BROWSER_HEADLESS values treated as true
+_TRUE_VALUES: frozenset[str] = frozenset({"true", "1", "yes"})
+# Upper bound on distinct WA_* environments memoized by Config.from_env
+_ENV_CACHE_SIZE = 128
+# Upper bound on distinct file versions memoized by Config.from_yaml
+_YAML_CACHE_SIZE = 128
+
+
+def _parse_env_number[N: (int, float)](
+    env: Mapping[str, str], env_key: str, default: N, convert: Callable[[str], N], type_name: str
+) -> N:
+    """Convert one numeric WA_* variable, falling back to default when it is unset."""
+    raw = env.get(env_key)
+    if raw is None:
+        # Unset variables take the typed default without a string round-trip
+        return default
+    try:
+        return convert(raw)
+    except ValueError as e:
+        raise ValueError(f"{env_key} must be a valid {type_name}: {e}") from e
+
+
+class Config(Struct, frozen=True, cache_hash=True, gc=False):
     """
     Configuration class for web automation testing framework.
 
     Provides type-safe configuration management with validation,
     environment variable support, and YAML file loading capabilities.
+    Instances are immutable; equality and hashing are implemented natively
+    by msgspec and the hash is computed once and cached on the instance.
+    All fields are scalars, so instances are not tracked by the garbage collector.
 
     Attributes:
         base_url: Base URL for the application under test (optional)
@@ -50,7 +100,7 @@ class Config(Struct, frozen=True):
     timeout: int = 30
     retry_count: int = 3
     retry_delay: float = 1.0
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    log_level: LogLevel = "INFO"
     browser_headless: bool = True
     browser_timeout: int = 30000
 
@@ -65,26 +115,52 @@ class Config(Struct, frozen=True):
             ValueError: If any validation fails
         """
         # Validate timeout
-        if not (1 <= self.timeout <= 300):
-            raise ValueError("timeout must be between 1 and 300 seconds")
+        if not (_TIMEOUT_MIN <= self.timeout <= _TIMEOUT_MAX):
+            raise ValueError(f"timeout must be between {_TIMEOUT_MIN} and {_TIMEOUT_MAX} seconds")
         # Validate retry_count
-        if not (0 <= self.retry_count <= 10):
-            raise ValueError("retry_count must be between 0 and 10")
+        if not (_RETRY_COUNT_MIN <= self.retry_count <= _RETRY_COUNT_MAX):
+            raise ValueError(
+                f"retry_count must be between {_RETRY_COUNT_MIN} and {_RETRY_COUNT_MAX}"
+            )
         # Validate retry_delay
-        if not (0.1 <= self.retry_delay <= 10.0):
-            raise ValueError("retry_delay must be between 0.1 and 10.0 seconds")
+        if not (_RETRY_DELAY_MIN <= self.retry_delay <= _RETRY_DELAY_MAX):
+            raise ValueError(
+                f"retry_delay must be between {_RETRY_DELAY_MIN} and {_RETRY_DELAY_MAX} seconds"
+            )
         # Validate browser_timeout
-        if not (1000 <= self.browser_timeout <= 300000):
-            raise ValueError("browser_timeout must be between 1000 and 300000 milliseconds")
+        if not (_BROWSER_TIMEOUT_MIN <= self.browser_timeout <= _BROWSER_TIMEOUT_MAX):
+            raise ValueError(
+                f"browser_timeout must be between {_BROWSER_TIMEOUT_MIN} and "
+                f"{_BROWSER_TIMEOUT_MAX} milliseconds"
+            )
         # Validate log_level (msgspec validates Literal, but we add explicit check for safety)
-        if self.log_level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise ValueError(
                 f"Invalid log level: {self.log_level}. "
                 "Must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL"
             )
 
     @classmethod
-    def from_env(cls) -> Config:
+    @cache
+    def default(cls) -> Config:
+        """
+        Return a shared Config instance with all default values.
+
+        The instance is built and validated once per class; Config is frozen,
+        so it is safe to share.
+
+        Returns:
+            Config: Configuration instance with default values
+
+        Example:
+            >>> config = Config.default()
+            >>> config.timeout
+            30
+        """
+        return cls()
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] | None = None) -> Config:
         """
         Create Config instance from environment variables.
 
@@ -97,6 +173,13 @@ class Config(Struct, frozen=True):
         - WA_BROWSER_HEADLESS: Run browser in headless mode (default: "true")
         - WA_BROWSER_TIMEOUT: Browser operation timeout in milliseconds (default: 30000)
 
+        Results are memoized on the values of the WA_* variables, so repeated calls
+        with an unchanged environment return the same instance. The most recent
+        _ENV_CACHE_SIZE environments are kept; use clear_env_cache() to drop them.
+
+        Args:
+            env: Mapping to read the variables from (default: os.environ)
+
         Returns:
             Config: Configuration instance created from environment variables
 
@@ -109,36 +192,33 @@ class Config(Struct, frozen=True):
             >>> os.environ["WA_BASE_URL"] = "https://example.com"
             >>> os.environ["WA_TIMEOUT"] = "60"
             >>> config = Config.from_env()
+            >>> config = Config.from_env({"WA_TIMEOUT": "60"})
         """
-        env = os.environ
+        # Read every variable from one plain-dict snapshot of the WA_* environment
+        source = os.environ if env is None else env
+        env = {key: source[key] for key in _WA_ENV_KEYS if key in source}
+        if not env:
+            return cls.default()
+        return cls._from_env_values(tuple(map(env.get, _WA_ENV_KEYS)))
+
+    @classmethod
+    @lru_cache(maxsize=_ENV_CACHE_SIZE)
+    def _from_env_values(cls, values: tuple[str | None, ...]) -> Config:
+        """Build and validate a Config from WA_* values ordered as _WA_ENV_KEYS."""
+        env = {
+            key: value for key, value in zip(_WA_ENV_KEYS, values, strict=True) if value is not None
+        }
         # Optional fields
         base_url = env.get("WA_BASE_URL")
-        browser_headless_str = env.get("WA_BROWSER_HEADLESS", "true").lower()
-        browser_headless = browser_headless_str in ("true", "1", "yes")
-        # Optional configuration fields
-        timeout_str = env.get("WA_TIMEOUT", "30")
-        try:
-            timeout = int(timeout_str)
-        except ValueError as e:
-            raise ValueError(f"WA_TIMEOUT must be a valid integer: {e}") from e
-        retry_count_str = env.get("WA_RETRY_COUNT", "3")
-        try:
-            retry_count = int(retry_count_str)
-        except ValueError as e:
-            raise ValueError(f"WA_RETRY_COUNT must be a valid integer: {e}") from e
-
-        retry_delay_str = env.get("WA_RETRY_DELAY", "1.0")
-        try:
-            retry_delay = float(retry_delay_str)
-        except ValueError as e:
-            raise ValueError(f"WA_RETRY_DELAY must be a valid float: {e}") from e
-        browser_timeout_str = env.get("WA_BROWSER_TIMEOUT", "30000")
-        try:
-            browser_timeout = int(browser_timeout_str)
-        except ValueError as e:
-            raise ValueError(f"WA_BROWSER_TIMEOUT must be a valid integer: {e}") from e
+        headless_raw = env.get("WA_BROWSER_HEADLESS")
+        browser_headless = headless_raw is None or headless_raw.lower() in _TRUE_VALUES
+        # Optional numeric configuration fields
+        timeout = _parse_env_number(env, "WA_TIMEOUT", 30, int, "integer")
+        retry_count = _parse_env_number(env, "WA_RETRY_COUNT", 3, int, "integer")
+        retry_delay = _parse_env_number(env, "WA_RETRY_DELAY", 1.0, float, "float")
+        browser_timeout = _parse_env_number(env, "WA_BROWSER_TIMEOUT", 30000, int, "integer")
         log_level = env.get("WA_LOG_LEVEL", "INFO").upper()
-        if log_level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+        if log_level not in _VALID_LOG_LEVELS:
             raise ValueError(
                 f"Invalid log level: {log_level}. "
                 "Must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL"
@@ -153,12 +233,25 @@ class Config(Struct, frozen=True):
             browser_timeout=browser_timeout,
         )
 
+    @classmethod
+    def clear_env_cache(cls) -> None:
+        """
+        Drop all Config instances memoized by from_env().
+
+        Example:
+            >>> Config.clear_env_cache()
+        """
+        cls._from_env_values.cache_clear()
+
     @classmethod
     def from_yaml(cls, file_path: str) -> Config:
         """
         Create Config instance from YAML file.
 
-        Loads configuration from a YAML file.
+        Loads configuration from a YAML file. Results are memoized on the resolved
+        path, modification time and size of the file, so loading an unchanged file
+        again returns the same instance without reading or re-parsing it. The most
+        recent _YAML_CACHE_SIZE files are kept; use clear_yaml_cache() to drop them.
 
         Args:
             file_path: Path to YAML configuration file
@@ -178,8 +271,46 @@ class Config(Struct, frozen=True):
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
         try:
-            with path.open(encoding="utf-8") as f:
-                data = load(f, Loader=SafeLoader)
+            # Resolve so the same relative path from another directory is a new key
+            path = path.resolve()
+            stat = path.stat()
+        except OSError as e:
+            raise ValueError(f"Failed to load configuration: {e}") from e
+        return cls._from_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    @lru_cache(maxsize=_YAML_CACHE_SIZE)
+    def _from_yaml_file(cls, path: str, mtime_ns: int, size: int) -> Config:
+        """Read and convert the YAML file at path; mtime_ns and size only key the cache."""
+        try:
+            # Hand the loader one contiguous buffer instead of a file stream
+            content = Path(path).read_bytes()
+        except OSError as e:
+            raise ValueError(f"Failed to load configuration: {e}") from e
+        return cls.from_yaml_string(content)
+
+    @classmethod
+    def from_yaml_string(cls, content: str | bytes) -> Config:
+        """
+        Create Config instance from a YAML document.
+
+        Parses the document and converts it the same way as from_yaml(), without
+        touching the filesystem. Results are not memoized.
+
+        Args:
+            content: YAML document as text or bytes
+
+        Returns:
+            Config: Configuration instance created from YAML document
+
+        Raises:
+            ValueError: If the YAML document is invalid or validation fails
+
+        Example:
+            >>> config = Config.from_yaml_string("timeout: 60\n")
+        """
+        try:
+            data = load(content, Loader=_YamlLoader)
         except Exception as e:
             raise ValueError(f"Failed to load configuration: {e}") from e
         if not isinstance(data, dict):
@@ -189,3 +320,77 @@ class Config(Struct, frozen=True):
             return cls(**data)
         except (TypeError, ValidationError) as e:
             raise ValueError(f"Invalid configuration data: {e}") from e
+
+    @classmethod
+    def clear_yaml_cache(cls) -> None:
+        """
+        Drop all Config instances memoized by from_yaml().
+
+        Example:
+            >>> Config.clear_yaml_cache()
+        """
+        cls._from_yaml_file.cache_clear()
+
+
+class LazyConfig:
+    """
+    Proxy that defers Config.from_env() until a setting is first read.
+
+    Importing code can hold a LazyConfig without parsing the environment;
+    the first attribute access builds the Config and later reads go to the
+    cached instance.
+
+    LazyConfig is not a Config subclass and does not compare equal to one.
+    Pass resolve() wherever a Config instance is expected.
+
+    Example:
+        >>> config = LazyConfig()
+        >>> config.timeout  # Config.from_env() runs here
+        30
+        >>> client = HttpClient("https://example.com", config.resolve())
+    """
+
+    __slots__ = ("_config", "_env")
+
+    def __init__(self, env: Mapping[str, str] | None = None) -> None:
+        """
+        Initialize lazy configuration.
+
+        Args:
+            env: Mapping passed to Config.from_env() (default: os.environ)
+        """
+        self._config: Config | None = None
+        self._env = env
+
+    def resolve(self) -> Config:
+        """
+        Return the underlying Config, building it on first use.
+
+        Returns:
+            Config: Configuration instance created from environment variables
+        """
+        if self._config is None:
+            self._config = Config.from_env(self._env)
+        return self._config
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward attribute access to the resolved Config.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            Attribute value of the underlying Config
+
+        Raises:
+            AttributeError: For private and special names, which are never
+                forwarded (keeps copy and pickle from resolving the Config)
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+
+# Shared settings read from the WA_* environment on first access
+config = LazyConfig()
@@ -29,6 +29,7 @@ from fixtures.api_client import (
 )
 from fixtures.config import (
     config_data_for_both_session_methods,
+    config_data_for_default_values,
     config_data_for_empty_strings,
     config_data_for_float_precision,
     config_data_for_invalid_log_level,
@@ -52,16 +53,21 @@ from fixtures.config import (
     invalid_config_data_minimal_retry_count,
     invalid_config_data_minimal_retry_delay,
     invalid_config_data_timeout,
+    mock_empty_environment,
     mock_environment,
     mock_environment_default_values,
+    mock_environment_invalid_type_conversion,
+    mock_environment_missing_session_string,
     mock_environment_optional_variables,
     mock_environment_override_defaults,
+    mock_environment_type_conversion,
+    shared_valid_config,
+    shared_valid_config_twin,
+    shared_valid_config_with_file,
     valid_config_data,
     valid_config_data_maximal,
     valid_config_data_minimal,
     valid_config_with_file_data,
-    yaml_config_data_minimal,
-    yaml_config_data_valid,
     yaml_config_file_empty,
     yaml_config_file_invalid,
     yaml_config_file_invalid_format,
@@ -70,6 +76,10 @@ from fixtures.config import (
     yaml_config_file_valid,
     yaml_config_file_with_file_session,
     yaml_config_file_with_mini_app,
+    yaml_config_minimal,
+    yaml_config_valid,
+    yaml_config_with_file_session,
+    yaml_config_with_mini_app,
 )
 # All fixtures from data_fixtures.py have been removed as they were not used in tests
 from fixtures.streaming_client import mock_websocket_connection
@@ -91,6 +101,7 @@ from fixtures.ui_client import (
     ui_client_with_browser,
     ui_client_with_config,
 )
+from utils.allure_steps import configure_steps
 
 
 def loguru_sink(message):
@@ -437,6 +448,16 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
                 terminalreporter.stats.pop("resource usage", None)
 
 
+def pytest_configure(config):
+    """
+    Turn inline Allure steps into no-ops unless an Allure report is collected.
+
+    Args:
+        config: Pytest config object
+    """
+    configure_steps(bool(config.getoption("allure_report_dir", None)))
+
+
 def pytest_addoption(parser):
     """
     Add command-line option to control resource usage filtering.
@@ -2,6 +2,9 @@
 Test data constants for TMA Framework tests.
 """
 
+# Python imports
+from types import MappingProxyType
+
 # API result test data
 VALID_API_RESULT_DATA = {
     "endpoint": "/api/status",
@@ -104,3 +107,168 @@ INFORMATIONAL_API_RESULT_DATA = {
     "reason": "Switching Protocols",
     "error_message": None,
 }
+
+# Config test data (read-only mappings, safe to share between tests)
+VALID_CONFIG_DATA = MappingProxyType(
+    {
+        "base_url": "https://example.com",
+        "timeout": 30,
+        "retry_count": 3,
+        "retry_delay": 1.0,
+        "log_level": "INFO",
+        "browser_headless": True,
+        "browser_timeout": 30000,
+    }
+)
+
+VALID_CONFIG_DATA_MINIMAL = MappingProxyType(
+    {
+        "timeout": 1,
+        "retry_count": 0,
+        "retry_delay": 0.1,
+    }
+)
+
+VALID_CONFIG_DATA_MAXIMAL = MappingProxyType(
+    {
+        "base_url": "https://example.com",
+        "timeout": 300,
+        "retry_count": 10,
+        "retry_delay": 10.0,
+        "log_level": "DEBUG",
+        "browser_headless": False,
+        "browser_timeout": 60000,
+    }
+)
+
+VALID_CONFIG_WITH_FILE_DATA = MappingProxyType(
+    {
+        "base_url": "https://example.com",
+        "timeout": 30,
+        "retry_count": 3,
+        "retry_delay": 1.0,
+        "log_level": "DEBUG",
+        "browser_headless": True,
+        "browser_timeout": 30000,
+    }
+)
+
+# Invalid: must be >= 1
+INVALID_CONFIG_DATA_TIMEOUT = MappingProxyType({"timeout": 0})
+
+# Invalid: must be >= 0
+INVALID_CONFIG_DATA_MINIMAL_RETRY_COUNT = MappingProxyType({"retry_count": -1})
+
+# Invalid: must be <= 10
+INVALID_CONFIG_DATA_MAXIMAL_RETRY_COUNT = MappingProxyType({"retry_count": 11})
+
+# Invalid: must be >= 0.1
+INVALID_CONFIG_DATA_RETRY_DELAY = MappingProxyType({"retry_delay": 0.05})
+
+# Invalid: must be >= 0.1
+INVALID_CONFIG_DATA_MINIMAL_RETRY_DELAY = MappingProxyType({"retry_delay": 0.0})
+
+# Invalid: must be <= 10.0
+INVALID_CONFIG_DATA_MAXIMAL_RETRY_DELAY = MappingProxyType({"retry_delay": 10.1})
+
+# Invalid: not a known level
+INVALID_CONFIG_DATA_LOG_LEVEL = MappingProxyType({"log_level": "INVALID"})
+
+# Config.from_env test environments (read-only mappings of WA_* variables)
+MOCK_ENVIRONMENT = MappingProxyType(
+    {
+        "WA_BASE_URL": "https://example.com",
+        "WA_TIMEOUT": "30",
+        "WA_RETRY_COUNT": "3",
+        "WA_RETRY_DELAY": "1.0",
+        "WA_LOG_LEVEL": "DEBUG",
+        "WA_BROWSER_HEADLESS": "true",
+        "WA_BROWSER_TIMEOUT": "30000",
+    }
+)
+
+MOCK_ENVIRONMENT_INVALID_API_ID = MappingProxyType(
+    {
+        "WA_TIMEOUT": "invalid",  # Invalid: must be a number
+    }
+)
+
+MOCK_ENVIRONMENT_DEFAULT_VALUES = MappingProxyType(
+    {
+        "WA_BASE_URL": "https://example.com",
+        "WA_TIMEOUT": "30",
+        "WA_RETRY_COUNT": "3",
+        "WA_RETRY_DELAY": "1.0",
+        "WA_LOG_LEVEL": "INFO",
+    }
+)
+
+MOCK_ENVIRONMENT_OVERRIDE_DEFAULTS = MappingProxyType(
+    {
+        "WA_BASE_URL": "https://example.com",
+        "WA_TIMEOUT": "60",
+        "WA_RETRY_COUNT": "5",
+        "WA_RETRY_DELAY": "2.0",
+        "WA_LOG_LEVEL": "WARNING",
+    }
+)
+
+MOCK_ENVIRONMENT_OPTIONAL_VARIABLES = MappingProxyType(
+    {
+        "WA_BASE_URL": "https://example.com",
+        "WA_BROWSER_HEADLESS": "false",
+        "WA_BROWSER_TIMEOUT": "60000",
+    }
+)
+
+MOCK_EMPTY_ENVIRONMENT = MappingProxyType({})
+
+MOCK_ENVIRONMENT_MISSING_SESSION_STRING = MappingProxyType(
+    {
+        "WA_BASE_URL": "https://example.com",
+    }
+)
+
+MOCK_ENVIRONMENT_TYPE_CONVERSION = MappingProxyType(
+    {
+        "WA_TIMEOUT": "45",
+        "WA_RETRY_COUNT": "2",
+        "WA_RETRY_DELAY": "1.5",
+        "WA_BROWSER_HEADLESS": "yes",
+        "WA_BROWSER_TIMEOUT": "45000",
+    }
+)
+
+MOCK_ENVIRONMENT_INVALID_TYPE_CONVERSION = MappingProxyType(
+    {
+        "WA_RETRY_COUNT": "three",  # Invalid: must be a number
+    }
+)
+
+# Inline YAML configs parsed with Config.from_yaml_string()
+YAML_CONFIG_TEMPLATES = MappingProxyType(
+    {
+        "boundary_min": (
+            'base_url: "https://example.com"\n'
+            "timeout: 1\n"
+            "retry_count: 0\n"
+            "retry_delay: 0.1\n"
+            'log_level: "DEBUG"\n'
+            "browser_headless: false\n"
+            "browser_timeout: 1000\n"
+        ),
+        "boundary_max": (
+            'base_url: "https://example.com"\n'
+            "timeout: 300\n"
+            "retry_count: 10\n"
+            "retry_delay: 10.0\n"
+            'log_level: "CRITICAL"\n'
+            "browser_headless: false\n"
+            "browser_timeout: 300000\n"
+        ),
+        "timeout_30": 'base_url: "https://example.com"\ntimeout: 30\n',
+        "timeout_zero": 'base_url: "https://example.com"\ntimeout: 0\n',
+        "log_level_lowercase": 'base_url: "https://example.com"\nlog_level: "debug"\n',
+        "null_optional": "base_url: null\ntimeout: 45\n",
+    }
+)
@@ -18,9 +18,9 @@ if TYPE_CHECKING:
     from py_web_automation.clients.api_clients.graphql_client import GraphQLClient
 
 
-@fixture
+@fixture(scope="module")
 def valid_config() -> Config:
-    """Create a valid Config instance."""
+    """Create a valid Config instance (immutable, shared per module)."""
     return Config(
         base_url="https://example.com",
         timeout=30,
@@ -32,10 +32,10 @@ def valid_config() -> Config:
     )
 
 
-@fixture
-def mock_httpx_response_200(mocker: MockerFixture) -> Response:
-    """Create a mock httpx.Response with status 200."""
-    response = mocker.MagicMock(spec=Response)
+@fixture(scope="module")
+def mock_httpx_response_200(module_mocker: MockerFixture) -> Response:
+    """Create a mock httpx.Response with status 200 (read-only, shared per module)."""
+    response = module_mocker.MagicMock(spec=Response)
     response.status_code = 200
     response.elapsed = timedelta(seconds=0.5)
     response.is_informational = False
@@ -1,82 +1,131 @@
 # Python imports
 import os
+from collections.abc import Mapping
 from os import environ
-from pathlib import Path
+from typing import NamedTuple
+
+from data.constants import (
+    INVALID_CONFIG_DATA_LOG_LEVEL,
+    INVALID_CONFIG_DATA_MAXIMAL_RETRY_COUNT,
+    INVALID_CONFIG_DATA_MAXIMAL_RETRY_DELAY,
+    INVALID_CONFIG_DATA_MINIMAL_RETRY_COUNT,
+    INVALID_CONFIG_DATA_MINIMAL_RETRY_DELAY,
+    INVALID_CONFIG_DATA_RETRY_DELAY,
+    INVALID_CONFIG_DATA_TIMEOUT,
+    MOCK_EMPTY_ENVIRONMENT,
+    MOCK_ENVIRONMENT,
+    MOCK_ENVIRONMENT_DEFAULT_VALUES,
+    MOCK_ENVIRONMENT_INVALID_API_ID,
+    MOCK_ENVIRONMENT_INVALID_TYPE_CONVERSION,
+    MOCK_ENVIRONMENT_MISSING_SESSION_STRING,
+    MOCK_ENVIRONMENT_OPTIONAL_VARIABLES,
+    MOCK_ENVIRONMENT_OVERRIDE_DEFAULTS,
+    MOCK_ENVIRONMENT_TYPE_CONVERSION,
+    VALID_CONFIG_DATA,
+    VALID_CONFIG_DATA_MAXIMAL,
+    VALID_CONFIG_DATA_MINIMAL,
+    VALID_CONFIG_WITH_FILE_DATA,
+)
 from pytest import fixture
-from pytest_mock import MockerFixture
 from yaml import SafeLoader, load  # type: ignore[import-untyped]
 
+# Local imports
+from py_web_automation.config import Config
 
-@fixture
-def valid_config_data() -> dict[str, int | str | float | bool]:
+
+@fixture(scope="session")
+def valid_config_data() -> Mapping[str, int | str | float | bool]:
     """
     Valid configuration data.
 
     Returns:
-        dict[str, int | str | float | bool]: Valid configuration data.
+        Mapping[str, int | str | float | bool]: Read-only valid configuration data.
     """
-    return {
-        "base_url": "https://example.com",
-        "timeout": 30,
-        "retry_count": 3,
-        "retry_delay": 1.0,
-        "log_level": "INFO",
-        "browser_headless": True,
-        "browser_timeout": 30000,
-    }
+    return VALID_CONFIG_DATA
+
+
+@fixture(scope="session")
+def shared_valid_config(valid_config_data: Mapping[str, int | str | float | bool]) -> Config:
+    """
+    Config built once per session from valid configuration data.
+
+    Config is frozen, so tests that only read it can share one instance.
+
+    Args:
+        valid_config_data: Valid configuration data.
+
+    Returns:
+        Config: Validated configuration.
+    """
+    return Config(**valid_config_data)  # type: ignore[arg-type]
+
+
+@fixture(scope="session")
+def shared_valid_config_twin(valid_config_data: Mapping[str, int | str | float | bool]) -> Config:
+    """
+    Second Config built from the same data as shared_valid_config.
+
+    Used by equality and hash tests that need two distinct, equal instances.
+
+    Args:
+        valid_config_data: Valid configuration data.
+
+    Returns:
+        Config: Validated configuration.
+    """
+    return Config(**valid_config_data)  # type: ignore[arg-type]
+
+
+@fixture(scope="session")
+def shared_valid_config_with_file(
+    valid_config_with_file_data: Mapping[str, int | str | float | bool],
+) -> Config:
+    """
+    Config built once per session from valid configuration data with file.
+
+    Differs from shared_valid_config, for inequality and hash inequality tests.
+
+    Args:
+        valid_config_with_file_data: Valid configuration data with file.
+
+    Returns:
+        Config: Validated configuration.
+    """
+    return Config(**valid_config_with_file_data)  # type: ignore[arg-type]
 
 
 @fixture
-def valid_config_data_minimal() -> dict[str, int | str | float | bool]:
+def valid_config_data_minimal() -> Mapping[str, int | str | float | bool]:
     """
     Valid configuration data minimal.
 
     Returns:
-        dict[str, int | str | float | bool]: Valid configuration data minimal.
+        Mapping[str, int | str | float | bool]: Read-only valid configuration data minimal.
     """
-    return {
-        "timeout": 1,
-        "retry_count": 0,
-        "retry_delay": 0.1,
-    }
+    return VALID_CONFIG_DATA_MINIMAL
 
 
 @fixture
-def valid_config_data_maximal() -> dict[str, int | str | float | bool]:
+def valid_config_data_maximal() -> Mapping[str, int | str | float | bool]:
     """
     Valid configuration data maximal.
 
     Returns:
-        dict[str, int | str | float | bool]: Valid configuration data maximal.
+        Mapping[str, int | str | float | bool]: Read-only valid configuration data maximal.
     """
-    return {
-        "base_url": "https://example.com",
-        "timeout": 300,
-        "retry_count": 10,
-        "retry_delay": 10.0,
-        "log_level": "DEBUG",
-        "browser_headless": False,
-        "browser_timeout": 60000,
-    }
+    return VALID_CONFIG_DATA_MAXIMAL
 
 
-@fixture
-def valid_config_with_file_data() -> dict[str, int | str | float | bool]:
+@fixture(scope="session")
+def valid_config_with_file_data() -> Mapping[str, int | str | float | bool]:
     """
     Valid configuration data (no session file in new Config).
 
     Returns:
-        dict[str, int | str | float | bool]: Valid configuration data.
+        Mapping[str, int | str | float | bool]: Read-only valid configuration data
+            (no session file in new Config).
     """
-    return {
-        "base_url": "https://example.com",
-        "timeout": 30,
-        "retry_count": 3,
-        "retry_delay": 1.0,
-        "log_level": "DEBUG",
-        "browser_headless": True,
-        "browser_timeout": 30000,
-    }
+    return VALID_CONFIG_WITH_FILE_DATA
 
 
 @fixture
@@ -91,68 +140,58 @@ def invalid_config_data_api_id() -> dict[str, int | str | float]:
 
 
 @fixture
-def invalid_config_data_timeout() -> dict[str, int | str | float]:
+def invalid_config_data_timeout() -> Mapping[str, int | str | float]:
     """
     Invalid configuration data with timeout 0.
 
     Returns:
-        dict[str, int | str | float]: Invalid configuration data with timeout 0.
+        Mapping[str, int | str | float]: Invalid configuration data with timeout 0.
     """
-    return {
-        "timeout": 0,  # Invalid: must be >= 1
-    }
+    return INVALID_CONFIG_DATA_TIMEOUT
 
 
 @fixture
-def invalid_config_data_minimal_retry_count() -> dict[str, int | str | float]:
+def invalid_config_data_minimal_retry_count() -> Mapping[str, int | str | float]:
     """
     Invalid configuration data with minimal retry count.
 
     Returns:
-        dict[str, int | str | float]: Invalid configuration data with minimal retry count.
+        Mapping[str, int | str | float]: Invalid configuration data with minimal retry count.
     """
-    return {
-        "retry_count": -1,  # Invalid: must be >= 0
-    }
+    return INVALID_CONFIG_DATA_MINIMAL_RETRY_COUNT
 
 
 @fixture
-def invalid_config_data_maximal_retry_count() -> dict[str, int | str | float]:
+def invalid_config_data_maximal_retry_count() -> Mapping[str, int | str | float]:
     """
     Invalid configuration data with maximal retry count.
 
     Returns:
-        dict[str, int | str | float]: Invalid configuration data with maximal retry count.
+        Mapping[str, int | str | float]: Invalid configuration data with maximal retry count.
     """
-    return {
-        "retry_count": 11,  # Invalid: must be <= 10
-    }
+    return INVALID_CONFIG_DATA_MAXIMAL_RETRY_COUNT
 
 
 @fixture
-def invalid_config_data_minimal_retry_delay() -> dict[str, int | str | float]:
+def invalid_config_data_minimal_retry_delay() -> Mapping[str, int | str | float]:
     """
     Invalid configuration data with minimal retry delay.
 
     Returns:
-        dict[str, int | str | float]: Invalid configuration data with minimal retry delay.
+        Mapping[str, int | str | float]: Invalid configuration data with minimal retry delay.
     """
-    return {
-        "retry_delay": 0.0,  # Invalid: must be >= 0.1
-    }
+    return INVALID_CONFIG_DATA_MINIMAL_RETRY_DELAY
 
 
 @fixture
-def invalid_config_data_maximal_retry_delay() -> dict[str, int | str | float]:
+def invalid_config_data_maximal_retry_delay() -> Mapping[str, int | str | float]:
     """
     Invalid configuration data with maximal retry delay.
 
     Returns:
-        dict[str, int | str | float]: Invalid configuration data with maximal retry delay.
+        Mapping[str, int | str | float]: Invalid configuration data with maximal retry delay.
     """
-    return {
-        "retry_delay": 10.1,  # Invalid: must be <= 10.0
-    }
+    return INVALID_CONFIG_DATA_MAXIMAL_RETRY_DELAY
 
 
 @fixture
@@ -208,42 +247,36 @@ def config_data_for_missing_session() -> dict[str, int | str]:
 
 
 @fixture
-def config_data_for_invalid_log_level() -> dict[str, int | str]:
+def config_data_for_invalid_log_level() -> Mapping[str, int | str]:
     """
     Configuration data for testing invalid log level validation.
 
     Returns:
-        dict[str, int | str]: Configuration data with invalid log level.
+        Mapping[str, int | str]: Configuration data with invalid log level.
     """
-    return {
-        "log_level": "INVALID",  # Invalid: must be one of DEBUG, INFO, WARNING, ERROR, CRITICAL
-    }
+    return INVALID_CONFIG_DATA_LOG_LEVEL
 
 
 @fixture
-def config_data_for_invalid_retry_count() -> dict[str, int | str]:
+def config_data_for_invalid_retry_count() -> Mapping[str, int | str]:
     """
     Configuration data for testing invalid retry count validation.
 
     Returns:
-        dict[str, int | str]: Configuration data with invalid retry count.
+        Mapping[str, int | str]: Configuration data with invalid retry count.
     """
-    return {
-        "retry_count": -1,  # Invalid: must be >= 0
-    }
+    return INVALID_CONFIG_DATA_MINIMAL_RETRY_COUNT
 
 
 @fixture
-def config_data_for_invalid_retry_delay() -> dict[str, int | str | float]:
+def config_data_for_invalid_retry_delay() -> Mapping[str, int | str | float]:
     """
     Configuration data for testing invalid retry delay validation.
 
     Returns:
-        dict[str, int | str | float]: Configuration data with invalid retry delay.
+        Mapping[str, int | str | float]: Configuration data with invalid retry delay.
     """
-    return {
-        "retry_delay": 0.05,  # Invalid: must be >= 0.1
-    }
+    return INVALID_CONFIG_DATA_RETRY_DELAY
 
 
 @fixture
@@ -441,98 +474,107 @@ def config_data_for_large_numbers() -> dict[str, int | str | float]:
     }
 
 
-@fixture
-def mock_environment(mocker: MockerFixture) -> dict[str, str]:
+@fixture(scope="session")
+def mock_environment() -> Mapping[str, str]:
     """
     Mock environment variables for testing.
 
     Returns:
-        dict[str, str]: Environment variables.
+        Mapping[str, str]: Read-only environment variables.
     """
-    env_vars = {
-        "WA_BASE_URL": "https://example.com",
-        "WA_TIMEOUT": "30",
-        "WA_RETRY_COUNT": "3",
-        "WA_RETRY_DELAY": "1.0",
-        "WA_LOG_LEVEL": "DEBUG",
-        "WA_BROWSER_HEADLESS": "true",
-        "WA_BROWSER_TIMEOUT": "30000",
-    }
-    mocker.patch.dict(os.environ, env_vars, clear=True)
-    yield env_vars
+    return MOCK_ENVIRONMENT
 
 
-@fixture
-def mock_environment_invalid_api_id(mocker: MockerFixture) -> dict[str, str]:
+@fixture(scope="session")
+def mock_environment_invalid_api_id() -> Mapping[str, str]:
     """
     Mock environment variables with invalid WA_TIMEOUT for testing.
 
     Returns:
-        dict[str, str]: Environment variables with invalid WA_TIMEOUT.
+        Mapping[str, str]: Read-only environment variables with invalid WA_TIMEOUT.
     """
-    env_vars = {
-        "WA_TIMEOUT": "invalid",  # Invalid: must be a number
-    }
-    mocker.patch.dict(os.environ, env_vars, clear=True)
-    yield env_vars
+    return MOCK_ENVIRONMENT_INVALID_API_ID
 
 
-@fixture
-def mock_environment_default_values(mocker: MockerFixture) -> dict[str, str]:
+@fixture(scope="session")
+def mock_environment_default_values() -> Mapping[str, str]:
     """
     Mock environment variables with default values for testing.
 
     Returns:
-        dict[str, str]: Environment variables with default values.
+        Mapping[str, str]: Read-only environment variables with default values.
     """
-    env_vars = {
-        "WA_BASE_URL": "https://example.com",
-        "WA_TIMEOUT": "30",
-        "WA_RETRY_COUNT": "3",
-        "WA_RETRY_DELAY": "1.0",
-        "WA_LOG_LEVEL": "INFO",
-    }
-    mocker.patch.dict(os.environ, env_vars, clear=True)
-    yield env_vars
+    return MOCK_ENVIRONMENT_DEFAULT_VALUES
 
 
-@fixture
-def mock_environment_override_defaults(mocker: MockerFixture) -> dict[str, str]:
+@fixture(scope="session")
+def mock_environment_override_defaults() -> Mapping[str, str]:
     """
     Mock environment variables with overridden default values for testing.
 
     Returns:
-        dict[str, str]: Environment variables with overridden defaults.
+        Mapping[str, str]: Read-only environment variables with overridden defaults.
     """
-    env_vars = {
-        "WA_BASE_URL": "https://example.com",
-        "WA_TIMEOUT": "60",
-        "WA_RETRY_COUNT": "5",
-        "WA_RETRY_DELAY": "2.0",
-        "WA_LOG_LEVEL": "WARNING",
-    }
-    mocker.patch.dict(os.environ, env_vars, clear=True)
-    yield env_vars
+    return MOCK_ENVIRONMENT_OVERRIDE_DEFAULTS
 
 
-@fixture
-def mock_environment_optional_variables(mocker: MockerFixture) -> dict[str, str]:
+@fixture(scope="session")
+def mock_environment_optional_variables() -> Mapping[str, str]:
     """
     Mock environment variables with optional variables for testing.
 
     Returns:
-        dict[str, str]: Environment variables with optional variables.
+        Mapping[str, str]: Read-only environment variables with optional variables.
     """
-    env_vars = {
-        "WA_BASE_URL": "https://example.com",
-        "WA_BROWSER_HEADLESS": "false",
-        "WA_BROWSER_TIMEOUT": "60000",
-    }
-    mocker.patch.dict(os.environ, env_vars, clear=True)
-    yield env_vars
+    return MOCK_ENVIRONMENT_OPTIONAL_VARIABLES
 
 
-@fixture
+@fixture(scope="session")
+def mock_empty_environment() -> Mapping[str, str]:
+    """
+    Mock empty environment for testing.
+
+    Returns:
+        Mapping[str, str]: Read-only environment without any WA_* variables.
+    """
+    return MOCK_EMPTY_ENVIRONMENT
+
+
+@fixture(scope="session")
+def mock_environment_missing_session_string() -> Mapping[str, str]:
+    """
+    Mock environment variables with only the base URL set for testing.
+
+    Returns:
+        Mapping[str, str]: Read-only environment variables without numeric settings.
+    """
+    return MOCK_ENVIRONMENT_MISSING_SESSION_STRING
+
+
+@fixture(scope="session")
+def mock_environment_type_conversion() -> Mapping[str, str]:
+    """
+    Mock environment variables for type conversion testing.
+
+    Returns:
+        Mapping[str, str]: Read-only environment variables holding string-encoded values
+            of every type.
+    """
+    return MOCK_ENVIRONMENT_TYPE_CONVERSION
+
+
+@fixture(scope="session")
+def mock_environment_invalid_type_conversion() -> Mapping[str, str]:
+    """
+    Mock environment variables with invalid type conversion for testing.
+
+    Returns:
+        Mapping[str, str]: Read-only environment variables with non-numeric WA_RETRY_COUNT.
+    """
+    return MOCK_ENVIRONMENT_INVALID_TYPE_CONVERSION
+
+
+@fixture(scope="session")
 def yaml_config_file_valid() -> str:
     """
     Return path to valid YAML config file for testing.
@@ -543,7 +585,7 @@ def yaml_config_file_valid() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "valid_yaml.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_minimal() -> str:
     """
     Return path to minimal YAML config file for testing.
@@ -554,7 +596,7 @@ def yaml_config_file_minimal() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "minimal_config.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_with_file_session() -> str:
     """
     Return path to YAML config file with session_file for testing.
@@ -565,7 +607,7 @@ def yaml_config_file_with_file_session() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "config_with_file.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_invalid() -> str:
     """
     Return path to invalid YAML config file for testing.
@@ -576,7 +618,7 @@ def yaml_config_file_invalid() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "invalid_config.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_missing_session() -> str:
     """
     Return path to YAML config file missing session for testing.
@@ -587,7 +629,7 @@ def yaml_config_file_missing_session() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "missing_session_config.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_with_mini_app() -> str:
     """
     Return path to YAML config file with mini app settings for testing.
@@ -598,7 +640,7 @@ def yaml_config_file_with_mini_app() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "mini_app_config.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_empty() -> str:
     """
     Return path to empty YAML config file for testing.
@@ -609,7 +651,7 @@ def yaml_config_file_empty() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "data", "empty_config.yaml")
 
 
-@fixture
+@fixture(scope="session")
 def yaml_config_file_invalid_format() -> str:
     """
     Return path to YAML config file with invalid format for testing.
@@ -621,11 +663,18 @@ def yaml_config_file_invalid_format() -> str:
 
 
 # ============================================================================
-# YAML config data fixtures (parsed YAML data)
+# YAML config fixtures (file path with parsed YAML data)
 # ============================================================================
 
 
-def _load_yaml_data(file_name: str) -> dict[str, int | str | float | bool]:
+class YamlConfigFile(NamedTuple):
+    """YAML config file path paired with its parsed data."""
+
+    path: str
+    data: dict[str, int | str | float | bool]
+
+
+def _load_yaml_data(file_path: str) -> dict[str, int | str | float | bool]:
     """
     Helper function to load YAML data from file.
 
@@ -639,13 +688,12 @@ def _load_yaml_data(file_name: str) -> dict[str, int | str | float | bool]:
     - WA_BROWSER_TIMEOUT overrides browser_timeout
 
     Args:
-        file_name: Name of the YAML file in tests/data/.
+        file_path: Full path to the YAML file.
 
     Returns:
         dict: Parsed YAML data with optional env var overrides.
     """
-    file_path = Path(__file__).parent.parent / "data" / file_name
-    with file_path.open() as f:
+    with open(file_path) as f:
         config_data = load(f, Loader=SafeLoader)
     # Override fields with environment variables if present (WA_* prefix)
     if environ.get("WA_BASE_URL"):
@@ -659,29 +707,56 @@ def _load_yaml_data(file_name: str) -> dict[str, int | str | float | bool]:
     if environ.get("WA_LOG_LEVEL"):
         config_data["log_level"] = environ.get("WA_LOG_LEVEL")
     if environ.get("WA_BROWSER_HEADLESS"):
-        config_data["browser_headless"] = environ.get("WA_BROWSER_HEADLESS", "true").lower() in ("true", "1", "yes")
+        headless = environ.get("WA_BROWSER_HEADLESS", "true")
+        config_data["browser_headless"] = headless.lower() in ("true", "1", "yes")
     if environ.get("WA_BROWSER_TIMEOUT"):
         config_data["browser_timeout"] = int(environ.get("WA_BROWSER_TIMEOUT", "30000"))
     return config_data
 
 
 @fixture
-def yaml_config_data_valid() -> dict[str, int | str | float | bool]:
+def yaml_config_valid(yaml_config_file_valid: str) -> YamlConfigFile:
+    """
+    Return path and parsed data of the valid YAML config file.
+
+    Returns:
+        YamlConfigFile: Path to the YAML file and its parsed data.
+    """
+    return YamlConfigFile(yaml_config_file_valid, _load_yaml_data(yaml_config_file_valid))
+
+
+@fixture
+def yaml_config_minimal(yaml_config_file_minimal: str) -> YamlConfigFile:
+    """
+    Return path and parsed data of the minimal YAML config file.
+
+    Returns:
+        YamlConfigFile: Path to the YAML file and its parsed data.
+    """
+    return YamlConfigFile(yaml_config_file_minimal, _load_yaml_data(yaml_config_file_minimal))
+
+
+@fixture
+def yaml_config_with_file_session(yaml_config_file_with_file_session: str) -> YamlConfigFile:
     """
-    Return parsed YAML config data for valid config.
+    Return path and parsed data of the YAML config file with session_file.
 
     Returns:
-        dict: Parsed YAML config data.
+        YamlConfigFile: Path to the YAML file and its parsed data.
     """
-    return _load_yaml_data("valid_yaml.yaml")
+    return YamlConfigFile(
+        yaml_config_file_with_file_session, _load_yaml_data(yaml_config_file_with_file_session)
+    )
 
 
 @fixture
-def yaml_config_data_minimal() -> dict[str, int | str | float | bool]:
+def yaml_config_with_mini_app(yaml_config_file_with_mini_app: str) -> YamlConfigFile:
     """
-    Return parsed YAML config data for minimal config.
+    Return path and parsed data of the YAML config file with mini app settings.
 
     Returns:
-        dict: Parsed YAML config data.
+        YamlConfigFile: Path to the YAML file and its parsed data.
     """
-    return _load_yaml_data("minimal_config.yaml")
+    return YamlConfigFile(
+        yaml_config_file_with_mini_app, _load_yaml_data(yaml_config_file_with_mini_app)
+    )
@@ -0,0 +1,344 @@
+"""
+Unit tests for HttpClient authentication and request building.
+"""
+
+# Python imports
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pytest import FixtureRequest, fixture, mark, param
+from pytest_mock import MockerFixture
+from utils.allure_steps import description, step, title
+
+# Local imports
+from py_web_automation.clients.api_clients.http_client import HttpClient
+from py_web_automation.clients.api_clients.http_client.middleware import (
+    AuthMiddleware,
+    MiddlewareChain,
+)
+from py_web_automation.config import Config
+
+# Apply markers to all tests in this module
+pytestmark = [mark.unit, mark.api]
+
+
+def _assert_bearer_token(call_kwargs: dict[str, Any]) -> None:
+    assert call_kwargs["headers"]["Authorization"] == "Bearer test_token_123"
+
+
+def _assert_no_auth_header(call_kwargs: dict[str, Any]) -> None:
+    assert "Authorization" not in call_kwargs["headers"]
+
+
+def _assert_custom_token_type(call_kwargs: dict[str, Any]) -> None:
+    assert call_kwargs["headers"]["Authorization"] == "ApiKey api_key_456"
+
+
+def _assert_explicit_auth_header_wins(call_kwargs: dict[str, Any]) -> None:
+    assert call_kwargs["headers"]["Authorization"] == "Bearer custom_token"
+
+
+def _assert_headers_merged_with_token(call_kwargs: dict[str, Any]) -> None:
+    headers = call_kwargs["headers"]
+    assert headers["Authorization"] == "Bearer test_token_123"
+    assert headers["X-Custom-Header"] == "custom_value"
+
+
+def _assert_json_content_type(call_kwargs: dict[str, Any]) -> None:
+    assert call_kwargs["headers"]["Content-Type"] == "application/json"
+    assert call_kwargs["json"] == {"key": "value"}
+
+
+def _assert_custom_content_type(call_kwargs: dict[str, Any]) -> None:
+    assert call_kwargs["headers"]["Content-Type"] == "application/xml"
+    assert call_kwargs["content"] == "<key>value</key>"
+    assert "json" not in call_kwargs
+
+
+def _assert_query_params(call_kwargs: dict[str, Any]) -> None:
+    query = parse_qs(urlsplit(call_kwargs["url"]).query)
+    assert query == {"page": ["1"], "limit": ["10"]}
+
+
+def _assert_query_params_appended(call_kwargs: dict[str, Any]) -> None:
+    query = parse_qs(urlsplit(call_kwargs["url"]).query)
+    assert query == {"existing": ["param"], "filter": ["active"]}
+
+
+def _assert_no_query_string(call_kwargs: dict[str, Any]) -> None:
+    assert "?" not in call_kwargs["url"]
+
+
+def _make_http_client(
+    config: Config, client: Any, middleware: MiddlewareChain | None = None
+) -> HttpClient:
+    """
+    Build HttpClient through its constructor, then inject a mock httpx client.
+
+    Args:
+        config: Configuration for the client
+        client: Mock httpx.AsyncClient instance assigned after construction
+        middleware: Optional middleware chain
+
+    Returns:
+        HttpClient instance using the given mock client
+    """
+    api = HttpClient("https://example.com/app", config, middleware=middleware)
+    api.client = client
+    return api
+
+
+@fixture(scope="class")
+def _shared_request_mock(class_mocker: MockerFixture, mock_httpx_response_200: Any) -> Any:
+    """Create one client.request AsyncMock shared by every test in a class."""
+    return class_mocker.AsyncMock(return_value=mock_httpx_response_200)
+
+
+@fixture
+def preconfigured_api(request: FixtureRequest, api_client_with_config: HttpClient) -> HttpClient:
+    """
+    Return api_client_with_config with an auth token preset from (token, token_type).
+
+    Use with indirect parametrization; a falsy token leaves the client without auth.
+    """
+    token, token_type = request.param
+    if token:
+        api_client_with_config._middleware = MiddlewareChain().add(
+            AuthMiddleware(token=token, token_type=token_type or "Bearer")
+        )
+    return api_client_with_config
+
+
+MAKE_REQUEST_CASES = [
+    param(
+        ("test_token_123", "Bearer"),
+        "/api/data",
+        "GET",
+        None,
+        None,
+        None,
+        _assert_bearer_token,
+        id="adds-auth-token",
+    ),
+    param(
+        (None, None),
+        "/api/data",
+        "GET",
+        None,
+        None,
+        None,
+        _assert_no_auth_header,
+        id="without-token",
+    ),
+    param(
+        ("api_key_456", "ApiKey"),
+        "/api/data",
+        "GET",
+        None,
+        None,
+        None,
+        _assert_custom_token_type,
+        id="custom-token-type",
+    ),
+    param(
+        ("default_token", "Bearer"),
+        "/api/data",
+        "GET",
+        None,
+        None,
+        {"Authorization": "Bearer custom_token"},
+        _assert_explicit_auth_header_wins,
+        id="headers-override-token",
+    ),
+    param(
+        ("test_token_123", "Bearer"),
+        "/api/data",
+        "GET",
+        None,
+        None,
+        {"X-Custom-Header": "custom_value"},
+        _assert_headers_merged_with_token,
+        id="merges-headers-with-token",
+    ),
+    param(
+        (None, None),
+        "/api/data",
+        "POST",
+        {"key": "value"},
+        None,
+        None,
+        _assert_json_content_type,
+        id="sets-json-content-type",
+    ),
+    param(
+        (None, None),
+        "/api/data",
+        "POST",
+        "<key>value</key>",
+        None,
+        {"Content-Type": "application/xml"},
+        _assert_custom_content_type,
+        id="preserves-custom-content-type",
+    ),
+    param(
+        (None, None),
+        "/api/data",
+        "GET",
+        None,
+        {"page": 1, "limit": 10},
+        None,
+        _assert_query_params,
+        id="query-params",
+    ),
+    param(
+        (None, None),
+        "https://example.com/api/data?existing=param",
+        "GET",
+        None,
+        {"filter": "active"},
+        None,
+        _assert_query_params_appended,
+        id="query-params-with-existing-query",
+    ),
+    param(
+        (None, None),
+        "/api/data",
+        "GET",
+        None,
+        {},
+        None,
+        _assert_no_query_string,
+        id="empty-params",
+    ),
+]
+
+
+class TestHttpClientAuthTokenSync:
+    """Test HttpClient auth token handling that needs no event loop."""
+
+    pytestmark = mark.fast
+
+    @title("HttpClient initializes without auth middleware")
+    @description("Test HttpClient.__init__() sets default values and no middleware.")
+    def test_init_sets_default_auth_values(
+        self, valid_config: Config, mock_httpx_client: Any
+    ) -> None:
+        """Test HttpClient.__init__() sets default values and no middleware."""
+        with step("Create HttpClient with injected mock client"):
+            api = _make_http_client(valid_config, mock_httpx_client)
+        with step("Verify default values"):
+            assert api.url == "https://example.com/app"
+            assert api.config is valid_config
+            assert api._middleware is None
+
+
+class TestHttpClientAuthToken:
+    """Test HttpClient authentication via AuthMiddleware and request building."""
+
+    @fixture(autouse=True)
+    def _mock_request(self, api_client_with_config: HttpClient, _shared_request_mock: Any) -> Any:
+        """Attach the shared AsyncMock to client.request and reset it after each test."""
+        api_client_with_config.client.request = _shared_request_mock
+        yield _shared_request_mock
+        _shared_request_mock.reset_mock()
+
+    @mark.asyncio
+    @mark.parametrize(
+        "preconfigured_api, url, method, data, params, extra_headers, assertions",
+        MAKE_REQUEST_CASES,
+        indirect=["preconfigured_api"],
+    )
+    @title("HttpClient make_request builds headers and query string")
+    @description(
+        "Test HttpClient.make_request() applies auth token, custom headers, "
+        "content type and query parameters to the outgoing request."
+    )
+    async def test_make_request_headers_and_params(
+        self,
+        preconfigured_api: HttpClient,
+        _mock_request: Any,
+        url: str,
+        method: str,
+        data: Any,
+        params: dict[str, Any] | None,
+        extra_headers: dict[str, str] | None,
+        assertions: Callable[..., None],
+    ) -> None:
+        """
+        Test HttpClient.make_request() builds the outgoing request.
+
+        Args:
+            preconfigured_api: Client with the case's auth token preset
+            url: Endpoint passed to make_request()
+            method: HTTP method
+            data: Request body
+            params: Query parameters
+            extra_headers: Headers passed to make_request()
+            assertions: Callable checking the kwargs passed to client.request()
+        """
+        await preconfigured_api.make_request(
+            url, method=method, data=data, params=params, headers=extra_headers
+        )
+        assertions(_mock_request.call_args.kwargs)
+
+    @mark.asyncio
+    @mark.parametrize(
+        "token_type, expected_header",
+        [
+            param(None, "Bearer test_token_123", id="default-bearer"),
+            param("ApiKey", "ApiKey test_token_123", id="custom-type"),
+        ],
+    )
+    @title("AuthMiddleware update_token sets the client's auth header")
+    @description(
+        "Test AuthMiddleware.update_token() on a constructed HttpClient adds the "
+        "Authorization header with the default or custom token type."
+    )
+    async def test_set_auth_token(
+        self,
+        api_client_with_config: HttpClient,
+        _mock_request: Any,
+        token_type: str | None,
+        expected_header: str,
+    ) -> None:
+        """
+        Test AuthMiddleware.update_token() sets the Authorization header.
+
+        Args:
+            api_client_with_config: HttpClient with mocked httpx client
+            _mock_request: client.request AsyncMock
+            token_type: Token type passed to update_token()
+            expected_header: Expected Authorization header value
+        """
+        with step("Attach auth middleware to HttpClient"):
+            auth = AuthMiddleware()
+            api_client_with_config._middleware = MiddlewareChain().add(auth)
+        with step("Set token and send request"):
+            auth.update_token("test_token_123", token_type)
+            await api_client_with_config.make_request("/api/data")
+        with step("Verify Authorization header"):
+            assert _mock_request.call_args.kwargs["headers"]["Authorization"] == expected_header
+
+    @mark.asyncio
+    @title("AuthMiddleware clear_token removes the client's auth header")
+    @description("Test AuthMiddleware.clear_token() stops HttpClient sending Authorization.")
+    async def test_clear_auth_token(
+        self, api_client_with_config: HttpClient, _mock_request: Any
+    ) -> None:
+        """
+        Test AuthMiddleware.clear_token() removes the Authorization header.
+
+        Args:
+            api_client_with_config: HttpClient with mocked httpx client
+            _mock_request: client.request AsyncMock
+        """
+        with step("Attach auth middleware with token set"):
+            auth = AuthMiddleware("test_token_123")
+            api_client_with_config._middleware = MiddlewareChain().add(auth)
+        with step("Clear token and send request"):
+            auth.clear_token()
+            await api_client_with_config.make_request("/api/data")
+        with step("Verify token and Authorization header are cleared"):
+            assert auth.token is None
+            _assert_no_auth_header(_mock_request.call_args.kwargs)
@@ -0,0 +1,98 @@
+"""
+Unit tests for Web Automation Framework configuration: validation of invalid data.
+"""
+
+import re
+from collections.abc import Mapping
+
+import pytest
+from data.constants import (
+    INVALID_CONFIG_DATA_LOG_LEVEL,
+    INVALID_CONFIG_DATA_MAXIMAL_RETRY_COUNT,
+    INVALID_CONFIG_DATA_MAXIMAL_RETRY_DELAY,
+    INVALID_CONFIG_DATA_MINIMAL_RETRY_COUNT,
+    INVALID_CONFIG_DATA_MINIMAL_RETRY_DELAY,
+    INVALID_CONFIG_DATA_RETRY_DELAY,
+    INVALID_CONFIG_DATA_TIMEOUT,
+)
+from pytest import mark, param, raises
+from utils.allure_steps import description, step, title
+
+# Local imports
+from py_web_automation.config import Config
+
+# Apply markers to all tests in this module
+pytestmark = [pytest.mark.unit]
+
+# Precompiled error-message patterns shared by the invalid-value tests
+_RE_TIMEOUT = re.compile(r"timeout must be between 1 and 300 seconds")
+_RE_RETRY_COUNT = re.compile(r"retry_count must be between 0 and 10")
+_RE_RETRY_DELAY = re.compile(r"retry_delay must be between 0\.1 and 10\.0")
+_RE_INVALID_LOG_LEVEL = re.compile(r"Invalid log level")
+
+
+# ============================================================================
+# I. Инициализация и валидация
+# ============================================================================
+
+
+@mark.unit
+@mark.parametrize(
+    "invalid_data, match",
+    [
+        param(
+            INVALID_CONFIG_DATA_TIMEOUT,
+            _RE_TIMEOUT,
+            id="TC-CONFIG-012-timeout",
+        ),
+        param(
+            INVALID_CONFIG_DATA_MINIMAL_RETRY_COUNT,
+            _RE_RETRY_COUNT,
+            id="TC-CONFIG-015-minimal-retry-count",
+        ),
+        param(
+            INVALID_CONFIG_DATA_MAXIMAL_RETRY_COUNT,
+            _RE_RETRY_COUNT,
+            id="TC-CONFIG-016-maximal-retry-count",
+        ),
+        param(
+            INVALID_CONFIG_DATA_RETRY_DELAY,
+            _RE_RETRY_DELAY,
+            id="TC-CONFIG-018-retry-delay",
+        ),
+        param(
+            INVALID_CONFIG_DATA_MINIMAL_RETRY_DELAY,
+            _RE_RETRY_DELAY,
+            id="TC-CONFIG-018-minimal-retry-delay",
+        ),
+        param(
+            INVALID_CONFIG_DATA_MAXIMAL_RETRY_DELAY,
+            _RE_RETRY_DELAY,
+            id="TC-CONFIG-019-maximal-retry-delay",
+        ),
+        param(
+            INVALID_CONFIG_DATA_LOG_LEVEL,
+            _RE_INVALID_LOG_LEVEL,
+            id="TC-CONFIG-023-log-level",
+        ),
+    ],
+)
+@title("TC-CONFIG-012: Configuration validation with invalid values")
+@description(
+    "TC-CONFIG-012, TC-CONFIG-015, TC-CONFIG-016, TC-CONFIG-018, TC-CONFIG-019, TC-CONFIG-023: "
+    "Test configuration validation rejects out-of-range values and invalid log level."
+)
+def test_config_validation_invalid_values(
+    invalid_data: Mapping[str, int | str | float],
+    match: re.Pattern[str],
+) -> None:
+    """
+    Test configuration validation with invalid values.
+
+    Args:
+        invalid_data: Invalid configuration data.
+        match: Expected error message pattern.
+    """
+    with step("Attempt to create Config with invalid data"):
+        with raises(ValueError, match=match):
+            Config(**invalid_data)  # type: ignore[arg-type]
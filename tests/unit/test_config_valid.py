@@ -0,0 +1,297 @@
+"""
+Unit tests for Web Automation Framework configuration: construction from valid data.
+"""
+
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+
+import pytest
+from data.constants import (
+    VALID_CONFIG_DATA,
+    VALID_CONFIG_DATA_MAXIMAL,
+    VALID_CONFIG_DATA_MINIMAL,
+    VALID_CONFIG_WITH_FILE_DATA,
+)
+from msgspec import to_builtins
+from msgspec.json import Decoder, Encoder
+from msgspec.structs import asdict
+from pytest import mark, param
+from utils.allure_steps import description, step, title
+
+# Local imports
+from py_web_automation.config import Config
+
+# Apply markers to all tests in this module
+pytestmark = [pytest.mark.unit]
+
+# Config fields compared in field-by-field checks
+_COMPARE_KEYS = (
+    "base_url",
+    "timeout",
+    "retry_count",
+    "retry_delay",
+    "log_level",
+    "browser_headless",
+    "browser_timeout",
+)
+
+# Field tuples read in a single C call, compared with tuple __eq__
+_config_fields = attrgetter(*_COMPARE_KEYS)
+_data_fields = itemgetter(*_COMPARE_KEYS)
+
+# Reused JSON encoder/decoder so msgspec builds Config's type info only once
+_JSON_ENCODER = Encoder()
+_CONFIG_DECODER = Decoder(Config)
+
+
+# ============================================================================
+# I. Инициализация и валидация
+# ============================================================================
+
+
+@mark.unit
+@mark.parametrize(
+    "valid_data",
+    [
+        param(VALID_CONFIG_DATA, id="TC-CONFIG-001-valid"),
+        param(VALID_CONFIG_WITH_FILE_DATA, id="TC-CONFIG-004-with-file"),
+        param(VALID_CONFIG_DATA_MINIMAL, id="TC-CONFIG-002-minimal"),
+        param(VALID_CONFIG_DATA_MAXIMAL, id="TC-CONFIG-002-maximal"),
+    ],
+)
+@title("TC-CONFIG-001: Create valid configuration")
+@description(
+    "TC-CONFIG-001, TC-CONFIG-002, TC-CONFIG-004: Test creating a valid configuration "
+    "from typical, minimal and maximal values."
+)
+def test_valid_config_creation(valid_data: Mapping[str, int | str | float]) -> None:
+    """
+    Test creating a valid configuration.
+
+    Args:
+        valid_data: Valid configuration data.
+    """
+    with step("Create Config from valid data"):
+        config = Config(**valid_data)  # type: ignore[arg-type]
+    with step("Verify configured values match"):
+        assert {k: getattr(config, k) for k in valid_data} == dict(valid_data)
+    with step("Verify validation passes"):
+        assert 1 <= config.timeout <= 300, "Timeout should be between 1 and 300"
+        assert 0 <= config.retry_count <= 10, "Retry count should be between 0 and 10"
+        assert 0.1 <= config.retry_delay <= 10.0, "Retry delay should be between 0.1 and 10.0"
+        assert config.log_level in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"), (
+            "Log level should be valid"
+        )
+
+
+@mark.unit
+@title("TC-CONFIG-002: Configuration default values")
+@description("TC-CONFIG-002: Test configuration default values.")
+def test_config_default_values(
+    config_data_for_default_values: dict[str, int | str],
+) -> None:
+    """Test configuration default values."""
+    with step("Create Config with default values"):
+        config = Config(**config_data_for_default_values)  # type: ignore[arg-type]
+    with step("Verify timeout default value"):
+        assert config.timeout == config_data_for_default_values["timeout"], (
+            "Timeout should be default 30"
+        )
+    with step("Verify retry_count default value"):
+        assert config.retry_count == config_data_for_default_values["retry_count"], (
+            "Retry count should be default 3"
+        )
+    with step("Verify retry_delay default value"):
+        assert config.retry_delay == config_data_for_default_values["retry_delay"], (
+            "Retry delay should be default 1.0"
+        )
+    with step("Verify log_level default value"):
+        assert config.log_level == config_data_for_default_values["log_level"], (
+            "Log level should be default INFO"
+        )
+    with step("Verify browser_headless default value"):
+        assert config.browser_headless == config_data_for_default_values.get(
+            "browser_headless", True
+        ), "Browser headless should be default True"
+    with step("Verify browser_timeout default value"):
+        assert config.browser_timeout == config_data_for_default_values.get(
+            "browser_timeout", 30000
+        ), "Browser timeout should be default 30000"
+    with step("Verify base_url default value"):
+        assert config.base_url is config_data_for_default_values["base_url"], (
+            "Base URL should be None by default"
+        )
+
+
+@mark.unit
+@title("TC-CONFIG-002: Shared default configuration")
+@description("TC-CONFIG-002: Test Config.default() returns one cached default instance.")
+def test_config_default_is_shared() -> None:
+    """Test Config.default() returns one cached default instance."""
+    with step("Get default Config twice"):
+        first = Config.default()
+        second = Config.default()
+    with step("Verify the same default instance is returned"):
+        assert first is second
+        assert first == Config()
+    with step("Verify from_env with empty environment returns the default"):
+        assert Config.from_env(env={}) is first
+
+
+@mark.unit
+@title("TC-CONFIG-021: Configuration validation (deprecated test)")
+@description("TC-CONFIG-021: Test configuration validation (deprecated - kept for compatibility).")
+def test_config_validation_missing_session(
+    config_data_for_missing_session: dict[str, int | str],
+) -> None:
+    """
+    Test configuration validation (deprecated - kept for compatibility).
+
+    Args:
+        config_data_for_missing_session: Configuration data (deprecated).
+    """
+    with step("Create Config with empty data (should use defaults)"):
+        config = Config(**config_data_for_missing_session)  # type: ignore[arg-type]
+        # Should create with default values
+        assert config.timeout == 30
+        assert config.retry_count == 3
+
+
+@mark.unit
+@title("TC-CONFIG-001: Configuration serialization")
+@description("TC-CONFIG-001: Test configuration serialization.")
+def test_config_serialization(
+    shared_valid_config: Config,
+    valid_config_data: Mapping[str, int | str | float],
+) -> None:
+    """
+    Test configuration serialization.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        valid_config_data: Valid configuration data.
+    """
+    with step("Serialize Config to dict"):
+        config_dict = to_builtins(shared_valid_config)
+    with step("Verify serialized dict"):
+        assert isinstance(config_dict, dict)
+        assert _data_fields(config_dict) == _data_fields(valid_config_data)
+
+
+@mark.unit
+@title("TC-CONFIG-001: Configuration deserialization")
+@description("TC-CONFIG-001: Test configuration deserialization.")
+def test_config_deserialization(
+    shared_valid_config: Config,
+    valid_config_data: Mapping[str, int | str | float],
+) -> None:
+    """
+    Test configuration deserialization from JSON bytes.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        valid_config_data: Valid configuration data.
+    """
+    with step("Round-trip Config through JSON bytes"):
+        restored = _CONFIG_DECODER.decode(_JSON_ENCODER.encode(shared_valid_config))
+    with step("Verify deserialized Config"):
+        assert isinstance(restored, Config)
+        assert restored == shared_valid_config
+        assert _config_fields(restored) == _data_fields(valid_config_data)
+
+
+@mark.unit
+@title("TC-CONFIG-001: Configuration equality with same data")
+@description("TC-CONFIG-001: Test configuration equality with same data.")
+def test_config_equality(shared_valid_config: Config, shared_valid_config_twin: Config) -> None:
+    """
+    Test configuration equality with same data.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        shared_valid_config_twin: Second Config built from the same data.
+    """
+    with step("Verify configurations are equal"):
+        assert shared_valid_config is not shared_valid_config_twin
+        assert shared_valid_config == shared_valid_config_twin, "Configuration should be equal"
+
+
+@mark.unit
+@title("TC-CONFIG-001: Configuration inequality with different data")
+@description("TC-CONFIG-001: Test configuration inequality with different data.")
+def test_config_inequality(
+    shared_valid_config: Config,
+    shared_valid_config_with_file: Config,
+) -> None:
+    """
+    Test configuration inequality with different data.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        shared_valid_config_with_file: Config built from valid configuration data with file.
+    """
+    with step("Verify configurations are not equal"):
+        assert shared_valid_config != shared_valid_config_with_file, (
+            "Configuration should be different"
+        )
+
+
+@mark.unit
+@title("TC-CONFIG-039: Configuration hash equality with same data")
+@description("TC-CONFIG-039: Test configuration hash equality with same data.")
+def test_config_hash_equality(
+    shared_valid_config: Config, shared_valid_config_twin: Config
+) -> None:
+    """
+    Test configuration hash equality with same data.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        shared_valid_config_twin: Second Config built from the same data.
+    """
+    with step("Verify configuration hashes are equal"):
+        assert hash(shared_valid_config) == hash(shared_valid_config_twin), (
+            "Configuration hashes should be equal"
+        )
+
+
+@mark.unit
+@title("TC-CONFIG-039: Configuration hash inequality with different data")
+@description("TC-CONFIG-039: Test configuration hash inequality with different data.")
+def test_config_hash_inequality(
+    shared_valid_config: Config,
+    shared_valid_config_with_file: Config,
+) -> None:
+    """
+    Test configuration hash inequality with different data.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        shared_valid_config_with_file: Config built from valid configuration data with file.
+    """
+    with step("Verify configuration hashes are not equal"):
+        assert hash(shared_valid_config) != hash(shared_valid_config_with_file), (
+            "Configuration hashes should be different"
+        )
+
+
+@mark.unit
+@title("TC-CONFIG-001: Configuration string representation")
+@description("TC-CONFIG-001: Test configuration string representation.")
+def test_config_repr(
+    shared_valid_config: Config,
+    valid_config_data: Mapping[str, int | str | float],
+) -> None:
+    """
+    Test configuration string representation.
+
+    Args:
+        shared_valid_config: Config built from valid configuration data.
+        valid_config_data: Valid configuration data.
+    """
+    with step("Verify repr names the class"):
+        assert "Config" in repr(shared_valid_config)
+    with step("Verify structured fields"):
+        fields = asdict(shared_valid_config)
+        assert fields["base_url"] == valid_config_data["base_url"]
+        assert fields["timeout"] == valid_config_data["timeout"]
@@ -0,0 +1,3 @@
+"""
+Test utilities package for py-web-automation tests.
+"""
@@ -0,0 +1,55 @@
+"""
+Allure helpers for unit tests.
+
+Allure steps are only useful when a report is being collected. This module
+provides a drop-in replacement for allure.step that returns a no-op context
+manager when pytest runs without --alluredir, so tests can keep their step
+structure without paying the reporter overhead in plain runs.
+
+The title and description decorators are re-exported from allure unchanged.
+They only attach labels to the test function, and they run at import time,
+before the --alluredir option is known in xdist workers.
+"""
+
+# Python imports
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+import allure
+from allure import description, title
+
+__all__ = ["configure_steps", "description", "step", "title"]
+
+_steps_enabled = True
+
+
+def configure_steps(enabled: bool) -> None:
+    """
+    Enable or disable recording of Allure steps.
+
+    Called from conftest.pytest_configure based on the --alluredir option.
+
+    Args:
+        enabled: True to forward steps to Allure, False to make them no-ops
+    """
+    global _steps_enabled
+    _steps_enabled = enabled
+
+
+def step(title: str) -> AbstractContextManager[Any]:
+    """
+    Open an Allure step, or a no-op context when no report is collected.
+
+    Args:
+        title: Step title shown in the Allure report
+
+    Returns:
+        Context manager wrapping the step
+
+    Example:
+        >>> with step("Create client"):
+        ...     client = HttpClient("https://example.com")
+    """
+    if _steps_enabled:
+        return allure.step(title)
+    return nullcontext()